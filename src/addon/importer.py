@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-import glob
+import concurrent.futures
 import os
 import bpy
-import bmesh
 import mathutils
-import math
-import numpy
 import time
-import subprocess
 import traceback
 
 from .. assets import (
@@ -33,8 +29,13 @@ from .. utils import (
 Import an IBSP file
 """
 def import_ibsp(assetpath: str, filepath: str) -> bool:
+    import numpy
+
     start_time_ibsp = time.monotonic()
 
+    _TEXTURE_CACHE.clear()
+    _IMAGES_DIR_CACHE.clear()
+
     IBSP = ibsp_asset.IBSP()
     if not IBSP.load(filepath):
         log.error_log(f"Error loading map: {filepath}")
@@ -51,24 +52,68 @@ def import_ibsp(assetpath: str, filepath: str) -> bool:
     bpy.context.scene.collection.objects.link(map_entities_null)
     map_entities_null.parent = map_null
 
+    # the extension is not defined inside the v59 format
+    # so we index the asset directory once and match materials against it by stem
+    texture_files = {}
+    if IBSP.version == ibsp_asset.VERSIONS.COD1:
+        for current_dir, _, files in os.walk(assetpath):
+            for file in files:
+                relative_path = os.path.relpath(os.path.join(current_dir, file), assetpath)
+                texture_files.setdefault(os.path.splitext(relative_path)[0], relative_path)
+
+    # parse the material files on a thread pool and convert the missing
+    # .dds textures in parallel up front, so the material builds below
+    # never wait on disk or on iwi2dds
+    material_payloads = {}
+    if IBSP.version != ibsp_asset.VERSIONS.COD1:
+        def load_material(material_name: str) -> material_asset.Material | None:
+            MATERIAL = material_asset.Material()
+            if not MATERIAL.load(xmodel_asset.VERSIONS.COD2, os.path.join(assetpath, material_asset.Material.PATH, material_name)):
+                return None
+
+            return MATERIAL
+
+        unique_material_names = {material.name for material in IBSP.materials}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            material_payloads = dict(zip(unique_material_names, executor.map(load_material, unique_material_names)))
+
+        map_texture_names = set()
+        for MATERIAL in material_payloads.values():
+            if MATERIAL != None:
+                map_texture_names.update(t.name for t in MATERIAL.textures if t.type in _LINKED_TEXTURE_TYPES)
+
+        _convert_textures(assetpath, map_texture_names)
+
     # import materials
+    # already imported materials are tracked in a local set so duplicates
+    # never reach the _import_material_* machinery
+    material_names = {}
+    seen_materials = set(bpy.data.materials.keys())
     for material in IBSP.materials:
         if IBSP.version == ibsp_asset.VERSIONS.COD1:
-            material_name = os.path.join(*material.name.split('/')) # material names are path names as well, so we create a proper path
+            material_name = material.name.replace('/', os.sep) # material names are path names as well, so we create a proper path
+            material_names[material.name] = material_name
 
-            # the extension is not defined inside the v59 format 
-            # so we try to match a pattern and retrieve the first matching file 
-            texture_file = ''
-            for tex in glob.iglob(os.path.join(assetpath, material_name + '.*')):
-                texture_file = tex.removeprefix(assetpath).lstrip('/\\')
-                break
-            
+            if material_name in seen_materials:
+                continue
+
+            texture_file = texture_files.get(material_name, '')
             if texture_file == '':
                 continue
 
+            seen_materials.add(material_name)
             _import_material_v14(assetpath, texture_file)
         else:
-            _import_material_v20(assetpath, material.name)
+            material_names[material.name] = material.name
+
+            if material.name in seen_materials:
+                continue
+
+            seen_materials.add(material.name)
+            _import_material_v20(assetpath, material.name, material_payloads.get(material.name))
+
+    # look up materials once instead of walking bpy.data.materials per surface
+    materials_by_name = {material.name: material for material in bpy.data.materials}
 
     # import surfaces
     for surface in IBSP.surfaces:
@@ -78,101 +123,91 @@ def import_ibsp(assetpath: str, filepath: str) -> bool:
         obj = bpy.data.objects.new(name, mesh)
         obj.parent = map_geometry_null
 
-        if IBSP.version == ibsp_asset.VERSIONS.COD1:
-            obj.active_material = bpy.data.materials.get(os.path.join(*surface.material.split('/')))
-        else:
-            obj.active_material = bpy.data.materials.get(surface.material)
+        obj.active_material = materials_by_name.get(material_names.get(surface.material, surface.material))
 
         bpy.context.scene.collection.objects.link(obj)
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-
-        mesh_data = bpy.context.object.data
-        bm = bmesh.new()
-
-        surface_uvs = []
-        surface_vertex_colors = []
-        surface_normals = []
-
-        for triangle in surface.triangles:
-            
-            vertex1 = surface.vertices[triangle[0]]
-            vertex2 = surface.vertices[triangle[2]]
-            vertex3 = surface.vertices[triangle[1]]
-
-            v1 = bm.verts.new(vertex1.position.to_tuple())
-            v2 = bm.verts.new(vertex2.position.to_tuple())
-            v3 = bm.verts.new(vertex3.position.to_tuple())
-
-            triangle_uvs = []
-            triangle_uvs.append(vertex1.uv.to_tuple())
-            triangle_uvs.append(vertex2.uv.to_tuple())
-            triangle_uvs.append(vertex3.uv.to_tuple())
-            surface_uvs.append(triangle_uvs)
-
-            triangle_vertex_colors = []
-            triangle_vertex_colors.append(vertex1.color.to_tuple())
-            triangle_vertex_colors.append(vertex2.color.to_tuple())
-            triangle_vertex_colors.append(vertex3.color.to_tuple())
-            surface_vertex_colors.append(triangle_vertex_colors)
-
-            triangle_normals = []
-            triangle_normals.append(vertex1.normal.to_tuple())
-            triangle_normals.append(vertex2.normal.to_tuple())
-            triangle_normals.append(vertex3.normal.to_tuple())
-            surface_normals.append(triangle_normals)
-
-            bm.verts.ensure_lookup_table()
-            bm.verts.index_update()
-
-            bm.faces.new((v1, v2, v3))
-            bm.faces.ensure_lookup_table()
-            bm.faces.index_update()
-
-        uv_layer = bm.loops.layers.uv.new()
-        vertex_color_layer = bm.loops.layers.color.new()
-        vertex_normal_buffer = []
-
-        for face, uv, color, normal in zip(bm.faces, surface_uvs, surface_vertex_colors, surface_normals):
-            for loop, uv_data, color_data, normal_data in zip(face.loops, uv, color, normal):
-                loop[uv_layer].uv = uv_data
-                loop[vertex_color_layer] = color_data
-                vertex_normal_buffer.append(normal_data)
-
-        bm.to_mesh(mesh_data)
-        bm.free()
-
-        # set normals        
+
+        positions = surface.positions_array()
+        uvs = surface.uvs_array()
+        colors = surface.colors_array()
+        normals = surface.normals_array()
+
+        vertex_count = len(positions)
+        indices = surface.triangles_array()[:, [0, 2, 1]]
+        triangle_count = len(indices)
+        loop_count = triangle_count * 3
+        loop_indices = indices.ravel()
+
+        mesh.vertices.add(vertex_count)
+        mesh.vertices.foreach_set('co', positions.ravel())
+
+        mesh.loops.add(loop_count)
+        mesh.loops.foreach_set('vertex_index', loop_indices)
+
+        mesh.polygons.add(triangle_count)
+        mesh.polygons.foreach_set('loop_start', numpy.arange(0, loop_count, 3, dtype=numpy.int32))
+        mesh.polygons.foreach_set('loop_total', numpy.full(triangle_count, 3, dtype=numpy.int32))
+
+        uv_layer = mesh.uv_layers.new()
+        uv_layer.data.foreach_set('uv', uvs[loop_indices].ravel())
+
+        vertex_color_layer = mesh.vertex_colors.new()
+        vertex_color_layer.data.foreach_set('color', colors[loop_indices].ravel())
+
+        mesh.update(calc_edges=True)
+
+        # set normals
         mesh.create_normals_split()
         mesh.validate(clean_customdata=False)
-        mesh.normals_split_custom_set(vertex_normal_buffer)
+        mesh.normals_split_custom_set(normals[loop_indices])
 
         polygon_count = len(mesh.polygons)
-        mesh.polygons.foreach_set('use_smooth', [True] * polygon_count)
+        mesh.polygons.foreach_set('use_smooth', numpy.ones(polygon_count, dtype=numpy.bool_))
         mesh.use_auto_smooth = True
 
     # entities
-    unique_entities = {}
+    # parsing the xmodel files is pure file IO, so the unique models are
+    # loaded on a thread pool while the bpy commits stay on the main thread
+    entity_paths = {}
     for entity in IBSP.entities:
-        if entity.name in unique_entities:
-            entity_null = blenderutils.copy_object_hierarchy(unique_entities[entity.name])[0]
-            bpy.ops.object.select_all(action='DESELECT')
-        else:
-            entity_path = os.path.join(assetpath, xmodel_asset.XModel.PATH, entity.name)
-            entity_null = import_xmodel(assetpath, entity_path, True)
-            
-        if entity_null:
-            entity_null.parent = map_entities_null
-            entity_null.location = entity.origin.to_tuple()
-            entity_null.scale = entity.scale.to_tuple()
-            entity_null.rotation_euler = (
-                math.radians(entity.angles.z), 
-                math.radians(entity.angles.x), 
-                math.radians(entity.angles.y)
-            )
-
-            if entity.name not in unique_entities:
-                unique_entities[entity.name] = entity_null
+        if entity.name not in entity_paths:
+            entity_paths[entity.name] = os.path.join(assetpath, xmodel_asset.XModel.PATH, entity.name)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        entity_payloads = dict(zip(entity_paths, executor.map(lambda path: _load_xmodel_payload(assetpath, path), entity_paths.values())))
+
+    # precompute all entity transforms in one numpy pass
+    entity_count = len(IBSP.entities)
+    entity_origins = numpy.fromiter((c for entity in IBSP.entities for c in entity.origin), dtype=numpy.float32, count=entity_count * 3).reshape(-1, 3)
+    entity_scales = numpy.fromiter((c for entity in IBSP.entities for c in entity.scale), dtype=numpy.float32, count=entity_count * 3).reshape(-1, 3)
+    entity_angles = numpy.radians(numpy.fromiter((c for entity in IBSP.entities for c in (entity.angles.z, entity.angles.x, entity.angles.y)), dtype=numpy.float32, count=entity_count * 3).reshape(-1, 3))
+
+    # each unique model is imported once into its own hidden collection and
+    # every placement is just an empty instancing that collection, so the
+    # object data is never duplicated
+    unique_entities = {}
+    for i, entity in enumerate(IBSP.entities):
+        entity_collection = unique_entities.get(entity.name)
+        if entity_collection == None:
+            entity_model = import_xmodel(assetpath, entity_paths[entity.name], True, entity_payloads[entity.name])
+            if not entity_model:
+                continue
+
+            entity_collection = bpy.data.collections.new(entity.name)
+            blenderutils.move_object_hierarchy_to_collection(entity_model, entity_collection)
+            bpy.context.scene.collection.children.link(entity_collection)
+            bpy.context.view_layer.layer_collection.children[entity_collection.name].exclude = True
+            unique_entities[entity.name] = entity_collection
+
+        entity_null = bpy.data.objects.new(entity.name, None)
+        entity_null.instance_type = 'COLLECTION'
+        entity_null.instance_collection = entity_collection
+        bpy.context.scene.collection.objects.link(entity_null)
+
+        entity_null.parent = map_entities_null
+        entity_null.location = entity_origins[i]
+        entity_null.scale = entity_scales[i]
+        entity_null.rotation_euler = entity_angles[i]
 
     done_time_d3dbsp = time.monotonic()
     log.info_log(f"Imported map: {IBSP.name} [{round(done_time_d3dbsp - start_time_ibsp, 2)}s]")
@@ -184,11 +219,9 @@ def import_ibsp(assetpath: str, filepath: str) -> bool:
 # ----------------------------------------------------------------------------------
 
 """
-Import an xmodel file
+Load an xmodel and its xmodelpart & xmodelsurf files without touching blender data
 """
-def import_xmodel(assetpath: str, filepath: str, import_skeleton: bool) -> bpy.types.Object | bool:
-    start_time_xmodel = time.monotonic()
-
+def _load_xmodel_payload(assetpath: str, filepath: str) -> tuple | bool:
     XMODEL = xmodel_asset.XModel()
     if not XMODEL.load(filepath):
         log.error_log(f"Error loading xmodel: {filepath}")
@@ -208,13 +241,48 @@ def import_xmodel(assetpath: str, filepath: str, import_skeleton: bool) -> bpy.t
         log.error_log(f"Error loading xmodelsurf: {xmodel_surf}")
         return False
 
+    return (XMODEL, XMODELPART, XMODELSURF)
+
+"""
+Import an xmodel file
+"""
+def import_xmodel(assetpath: str, filepath: str, import_skeleton: bool, payload: tuple = None) -> bpy.types.Object | bool:
+    import numpy
+
+    start_time_xmodel = time.monotonic()
+
+    if payload == None:
+        # standalone imports start with fresh caches, map imports clear
+        # them once up front in import_ibsp
+        _TEXTURE_CACHE.clear()
+        _IMAGES_DIR_CACHE.clear()
+
+        payload = _load_xmodel_payload(assetpath, filepath)
+
+    if not payload:
+        return False
+
+    XMODEL, XMODELPART, XMODELSURF = payload
+    lod0 = XMODEL.lods[0]
+
     xmodel_null = bpy.data.objects.new(XMODEL.name, None)
     bpy.context.scene.collection.objects.link(xmodel_null)
 
-    mesh_objects = []
-
     # import materials
+    # already imported materials are tracked in a local set so duplicates
+    # never reach the _import_material_* machinery
+    seen_materials = set(bpy.data.materials.keys())
     for material in lod0.materials:
+        if XMODEL.version == xmodel_asset.VERSIONS.COD1:
+            canonical_name = os.path.splitext(material)[0] # v14 materials are named by their texture stem
+        else:
+            canonical_name = material
+
+        if canonical_name in seen_materials:
+            continue
+
+        seen_materials.add(canonical_name)
+
         if XMODEL.version == xmodel_asset.VERSIONS.COD1:
             _import_material_v14(os.path.join(assetpath, 'skins'), material)
         elif XMODEL.version == xmodel_asset.VERSIONS.COD2:
@@ -223,98 +291,79 @@ def import_xmodel(assetpath: str, filepath: str, import_skeleton: bool) -> bpy.t
             _import_material_v25(assetpath, material)
 
     # create mesh
+    # all sub surfaces are merged into a single mesh and separated by material_index
+    mesh = bpy.data.meshes.new(XMODELSURF.name)
+    obj = bpy.data.objects.new(XMODELSURF.name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+
+    surface_positions = []
+    surface_uvs = []
+    surface_colors = []
+    surface_normals = []
+    surface_indices = []
+    surface_triangle_counts = []
+    mesh_vertex_weights = []
+
+    vertex_offset = 0
     for i, surface in enumerate(XMODELSURF.surfaces):
-        mesh = bpy.data.meshes.new(XMODELSURF.name)
-        obj = bpy.data.objects.new(XMODELSURF.name, mesh)
-
         if XMODEL.version == xmodel_asset.VERSIONS.COD1:
-            obj.active_material = bpy.data.materials.get(os.path.splitext(lod0.materials[i])[0])
+            mesh.materials.append(bpy.data.materials.get(os.path.splitext(lod0.materials[i])[0]))
         else:
-            obj.active_material = bpy.data.materials.get(lod0.materials[i])
-            
+            mesh.materials.append(bpy.data.materials.get(lod0.materials[i]))
 
-        bpy.context.scene.collection.objects.link(obj)
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-
-
-        mesh_data = bpy.context.object.data
-        bm = bmesh.new()
-        vertex_weight_layer = bm.verts.layers.deform.new()
-
-        surface_uvs = []
-        surface_vertex_colors = []
-        surface_normals = []
-
-        for triangle in surface.triangles:
-            
-            vertex1 = surface.vertices[triangle[0]]
-            vertex2 = surface.vertices[triangle[2]]
-            vertex3 = surface.vertices[triangle[1]]
-
-            triangle_uvs = []
-            triangle_uvs.append(vertex1.uv.to_tuple())
-            triangle_uvs.append(vertex2.uv.to_tuple())
-            triangle_uvs.append(vertex3.uv.to_tuple())
-            surface_uvs.append(triangle_uvs)
-
-            triangle_vertex_colors = []
-            triangle_vertex_colors.append(vertex1.color.to_tuple())
-            triangle_vertex_colors.append(vertex2.color.to_tuple())
-            triangle_vertex_colors.append(vertex3.color.to_tuple())
-            surface_vertex_colors.append(triangle_vertex_colors)
-
-            triangle_normals = []
-            triangle_normals.append(vertex1.normal.to_tuple())
-            triangle_normals.append(vertex2.normal.to_tuple())
-            triangle_normals.append(vertex3.normal.to_tuple())
-            surface_normals.append(triangle_normals)
-
-            v1 = bm.verts.new(vertex1.position.to_tuple())
-            v2 = bm.verts.new(vertex2.position.to_tuple())
-            v3 = bm.verts.new(vertex3.position.to_tuple())
-
-            bm.verts.ensure_lookup_table()
-            bm.verts.index_update()
-
-            verts_assoc = {
-                v1: vertex1,
-                v2: vertex2,
-                v3: vertex3
-            }
-
-            for bvert, svert in verts_assoc.items():
-                for weight in svert.weights:
-                    bm.verts[bvert.index][vertex_weight_layer][weight.bone] = weight.influence
-
-            bm.faces.new((v1, v2, v3))
-            bm.faces.ensure_lookup_table()
-            bm.faces.index_update()
-
-        uv_layer = bm.loops.layers.uv.new()
-        vertex_color_layer = bm.loops.layers.color.new()
-        vertex_normal_buffer = []
-
-        for face, uv, color, normal in zip(bm.faces, surface_uvs, surface_vertex_colors, surface_normals):
-            for loop, uv_data, color_data, normal_data in zip(face.loops, uv, color, normal):
-                loop[uv_layer].uv = uv_data
-                loop[vertex_color_layer] = color_data
-                vertex_normal_buffer.append(normal_data)
-
-        bm.to_mesh(mesh_data)
-        bm.free()
-
-        # set normals        
+        positions = surface.positions_array()
+        surface_positions.append(positions)
+        surface_uvs.append(surface.uvs_array())
+        surface_colors.append(surface.colors_array())
+        surface_normals.append(surface.normals_array())
+        surface_indices.append(surface.triangles_array()[:, [0, 2, 1]] + vertex_offset)
+        surface_triangle_counts.append(len(surface.triangles))
+        mesh_vertex_weights.extend(vertex.weights for vertex in surface.vertices)
+
+        vertex_offset += len(positions)
+
+    # a surf file can parse fine with zero surfaces, the object is then
+    # left as an empty mesh just like before the merged rebuild
+    if len(XMODELSURF.surfaces) > 0:
+        positions = numpy.concatenate(surface_positions)
+        uvs = numpy.concatenate(surface_uvs)
+        colors = numpy.concatenate(surface_colors)
+        normals = numpy.concatenate(surface_normals)
+        indices = numpy.concatenate(surface_indices)
+
+        vertex_count = len(positions)
+        triangle_count = len(indices)
+        loop_count = triangle_count * 3
+        loop_indices = indices.ravel()
+
+        mesh.vertices.add(vertex_count)
+        mesh.vertices.foreach_set('co', positions.ravel())
+
+        mesh.loops.add(loop_count)
+        mesh.loops.foreach_set('vertex_index', loop_indices)
+
+        mesh.polygons.add(triangle_count)
+        mesh.polygons.foreach_set('loop_start', numpy.arange(0, loop_count, 3, dtype=numpy.int32))
+        mesh.polygons.foreach_set('loop_total', numpy.full(triangle_count, 3, dtype=numpy.int32))
+        mesh.polygons.foreach_set('material_index', numpy.repeat(numpy.arange(len(XMODELSURF.surfaces), dtype=numpy.int32), surface_triangle_counts))
+
+        uv_layer = mesh.uv_layers.new()
+        uv_layer.data.foreach_set('uv', uvs[loop_indices].ravel())
+
+        vertex_color_layer = mesh.vertex_colors.new()
+        vertex_color_layer.data.foreach_set('color', colors[loop_indices].ravel())
+
+        mesh.update(calc_edges=True)
+
+        # set normals
         mesh.create_normals_split()
         mesh.validate(clean_customdata=False)
-        mesh.normals_split_custom_set(vertex_normal_buffer)
+        mesh.normals_split_custom_set(normals[loop_indices])
 
         polygon_count = len(mesh.polygons)
-        mesh.polygons.foreach_set('use_smooth', [True] * polygon_count)
+        mesh.polygons.foreach_set('use_smooth', numpy.ones(polygon_count, dtype=numpy.bool_))
         mesh.use_auto_smooth = True
 
-        mesh_objects.append(obj)
-
     # create skeleton
     skeleton = None
     if import_skeleton and XMODELPART != None and len(XMODELPART.bones) > 1:
@@ -355,42 +404,43 @@ def import_xmodel(assetpath: str, filepath: str, import_skeleton: bool) -> bpy.t
         bpy.ops.pose.armature_apply()
         bpy.context.view_layer.objects.active = skeleton
 
-        maxs = [0,0,0]
-        mins = [0,0,0]
+        bone_heads = numpy.fromiter((c for bone in armature.bones for c in bone.head_local), dtype=numpy.float32, count=len(armature.bones) * 3).reshape(-1, 3)
 
-        for bone in armature.bones:
-            for i in range(3):
-                maxs[i] = max(maxs[i], bone.head_local[i])
-                mins[i] = min(mins[i], bone.head_local[i])
+        # the bbox always includes the origin, just like the old running min/max did
+        maxs = numpy.maximum(bone_heads.max(0), 0)
+        mins = numpy.minimum(bone_heads.min(0), 0)
 
-        dimensions = []
-        for i in range(3):
-            dimensions.append(maxs[i] - mins[i])
-
-        length = max(0.001, (dimensions[0] + dimensions[1] + dimensions[2]) / 600)
+        dimensions = maxs - mins
+        length = max(0.001, dimensions.sum() / 600)
         bpy.ops.object.mode_set(mode='EDIT')
         for bone in [armature.edit_bones[b.name] for b in XMODELPART.bones]:
             bone.tail = bone.head + (bone.tail - bone.head).normalized() * length
 
         bpy.ops.object.mode_set(mode='OBJECT')
 
-    for mesh_object in mesh_objects:
-        if skeleton == None:
-            mesh_object.parent = xmodel_null
-            continue
-
+    if skeleton == None:
+        obj.parent = xmodel_null
+    else:
+        vertex_groups = []
         for bone in XMODELPART.bones:
-            mesh_object.vertex_groups.new(name=bone.name)
+            vertex_groups.append(obj.vertex_groups.new(name=bone.name))
+
+        # batch the weight assignment into one add() call per (bone, influence) group
+        weight_groups = {}
+        for vertex_index, vertex_weights in enumerate(mesh_vertex_weights):
+            for weight in vertex_weights:
+                weight_groups.setdefault((weight.bone, weight.influence), []).append(vertex_index)
 
-        mesh_object.parent = skeleton
-        modifier = mesh_object.modifiers.new('armature_rig', 'ARMATURE')
+        for (bone_index, influence), vertex_indices in weight_groups.items():
+            vertex_groups[bone_index].add(vertex_indices, influence, 'REPLACE')
+
+        obj.parent = skeleton
+        modifier = obj.modifiers.new('armature_rig', 'ARMATURE')
         modifier.object = skeleton
         modifier.use_bone_envelopes = False
         modifier.use_vertex_groups = True
 
     bpy.context.view_layer.update()
-    bpy.ops.object.mode_set(mode='OBJECT')
-    bpy.ops.object.select_all(action='DESELECT')
 
     done_time_xmodel = time.monotonic()
     log.info_log(f"Imported xmodel: {lod0.name} [{round(done_time_xmodel - start_time_xmodel, 2)}s]")
@@ -401,6 +451,89 @@ def import_xmodel(assetpath: str, filepath: str, import_skeleton: bool) -> bpy.t
 # MATERIAL IMPORT ------------------------------------------------------------------
 # ----------------------------------------------------------------------------------
 
+# only these types feed the node graph, anything else (detail maps etc.)
+# would load its texture just to leave an unconnected node behind
+_LINKED_TEXTURE_TYPES = (
+    texture_asset.TEXTURE_TYPE.COLORMAP,
+    texture_asset.TEXTURE_TYPE.SPECULARMAP,
+    texture_asset.TEXTURE_TYPE.NORMALMAP
+)
+
+NORMALMAP_NODE_GROUP = 'cod_normal_decode'
+
+"""
+Build the node group that decodes a normal map texture,
+the group is only built once and shared between all the materials
+"""
+def _get_normalmap_node_group() -> bpy.types.NodeTree:
+    node_group = bpy.data.node_groups.get(NORMALMAP_NODE_GROUP)
+    if node_group != None:
+        return node_group
+
+    SHADERNODES = blenderutils.BLENDER_SHADERNODES
+
+    node_group = bpy.data.node_groups.new(NORMALMAP_NODE_GROUP, 'ShaderNodeTree')
+    node_group.inputs.new('NodeSocketColor', 'Color')
+    node_group.inputs.new('NodeSocketFloat', 'Alpha')
+    node_group.outputs.new('NodeSocketVector', 'Normal')
+
+    nodes = node_group.nodes
+    links = node_group.links
+
+    group_input_node = nodes.new('NodeGroupInput')
+    group_input_node.location = (-1900, -655)
+
+    group_output_node = nodes.new('NodeGroupOutput')
+    group_output_node.location = (-250, -650)
+
+    normal_map_node = nodes.new(SHADERNODES.SHADERNODE_NORMALMAP)
+    normal_map_node.location = (-450, -650)
+    normal_map_node.space = SHADERNODES.NORMALMAP_SPACE_TANGENT
+    normal_map_node.inputs[SHADERNODES.INPUT_NORMALMAP_STRENGTH].default_value = 0.3
+    links.new(normal_map_node.outputs[SHADERNODES.OUTPUT_NORMALMAP_NORMAL], group_output_node.inputs[0])
+
+    combine_rgb_node = nodes.new(SHADERNODES.SHADERNODE_COMBINERGB)
+    combine_rgb_node.location = (-650, -750)
+    links.new(combine_rgb_node.outputs[SHADERNODES.OUTPUT_COMBINERGB_IMAGE], normal_map_node.inputs[SHADERNODES.INPUT_NORMALMAP_COLOR])
+
+    math_sqrt_node = nodes.new(SHADERNODES.SHADERNODE_MATH)
+    math_sqrt_node.location = (-850, -850)
+    math_sqrt_node.operation = SHADERNODES.OPERATION_MATH_SQRT
+    links.new(math_sqrt_node.outputs[SHADERNODES.OUTPUT_MATH_VALUE], combine_rgb_node.inputs[SHADERNODES.INPUT_COMBINERGB_B])
+
+    math_subtract_node = nodes.new(SHADERNODES.SHADERNODE_MATH)
+    math_subtract_node.location = (-1050, -850)
+    math_subtract_node.operation = SHADERNODES.OPERATION_MATH_SUBTRACT
+    links.new(math_subtract_node.outputs[SHADERNODES.OUTPUT_MATH_VALUE], math_sqrt_node.inputs[SHADERNODES.INPUT_MATH_SQRT_VALUE])
+
+    math_subtract_node2 = nodes.new(SHADERNODES.SHADERNODE_MATH)
+    math_subtract_node2.location = (-1250, -950)
+    math_subtract_node2.operation = SHADERNODES.OPERATION_MATH_SUBTRACT
+    math_subtract_node2.inputs[SHADERNODES.INPUT_MATH_SUBTRACT_VALUE1].default_value = 1.0
+    links.new(math_subtract_node2.outputs[SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node.inputs[SHADERNODES.INPUT_MATH_SUBTRACT_VALUE1])
+
+    math_power_node = nodes.new(SHADERNODES.SHADERNODE_MATH)
+    math_power_node.location = (-1250, -750)
+    math_power_node.operation = SHADERNODES.OPERATION_MATH_POWER
+    math_power_node.inputs[SHADERNODES.INPUT_MATH_POWER_EXPONENT].default_value = 2.0
+    links.new(math_power_node.outputs[SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node.inputs[SHADERNODES.INPUT_MATH_SUBTRACT_VALUE2])
+
+    math_power_node2 = nodes.new(SHADERNODES.SHADERNODE_MATH)
+    math_power_node2.location = (-1500, -950)
+    math_power_node2.operation = SHADERNODES.OPERATION_MATH_POWER
+    math_power_node2.inputs[SHADERNODES.INPUT_MATH_POWER_EXPONENT].default_value = 2.0
+    links.new(math_power_node2.outputs[SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node2.inputs[SHADERNODES.INPUT_MATH_SUBTRACT_VALUE2])
+    links.new(group_input_node.outputs[1], math_power_node2.inputs[SHADERNODES.INPUT_MATH_POWER_BASE])
+
+    separate_rgb_node = nodes.new(SHADERNODES.SHADERNODE_SEPARATERGB)
+    separate_rgb_node.location = (-1500, -450)
+    links.new(separate_rgb_node.outputs[SHADERNODES.OUTPUT_SEPARATERGB_G], combine_rgb_node.inputs[SHADERNODES.INPUT_COMBINERGB_G])
+    links.new(separate_rgb_node.outputs[SHADERNODES.OUTPUT_SEPARATERGB_G], math_power_node.inputs[SHADERNODES.INPUT_MATH_POWER_BASE])
+    links.new(group_input_node.outputs[0], separate_rgb_node.inputs[SHADERNODES.INPUT_SEPARATERGB_IMAGE])
+    links.new(group_input_node.outputs[1], combine_rgb_node.inputs[SHADERNODES.INPUT_COMBINERGB_R])
+
+    return node_group
+
 """
 Import a material file for CoD1 & CoD:UO (v14) assets and create node setup
 """
@@ -420,6 +553,8 @@ def _import_material_v14(assetpath: str, material_name: str) -> bool:
         material.blend_method = 'HASHED'
         material.shadow_method = 'HASHED'
 
+        SHADERNODES = blenderutils.BLENDER_SHADERNODES
+
         nodes = material.node_tree.nodes
         links = material.node_tree.links
 
@@ -433,30 +568,30 @@ def _import_material_v14(assetpath: str, material_name: str) -> bool:
                 output_node = node
 
         if output_node == None:
-            output_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_OUTPUTMATERIAL)
+            output_node = nodes.new(SHADERNODES.SHADERNODE_OUTPUTMATERIAL)
 
         output_node.location = (300, 0)
 
-        mix_shader_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MIXSHADER)
+        mix_shader_node = nodes.new(SHADERNODES.SHADERNODE_MIXSHADER)
         mix_shader_node.location = (100, 0)
-        links.new(mix_shader_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MIXSHADER_SHADER], output_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_OUTPUTMATERIAL_SURFACE])
+        links.new(mix_shader_node.outputs[SHADERNODES.OUTPUT_MIXSHADER_SHADER], output_node.inputs[SHADERNODES.INPUT_OUTPUTMATERIAL_SURFACE])
 
-        transparent_bsdf_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_BSDFTRANSPARENT)
+        transparent_bsdf_node = nodes.new(SHADERNODES.SHADERNODE_BSDFTRANSPARENT)
         transparent_bsdf_node.location = (-200, 100)
-        links.new(transparent_bsdf_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_SHADER1])
+        links.new(transparent_bsdf_node.outputs[SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_SHADER1])
 
-        principled_bsdf_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_BSDFPRINCIPLED)
+        principled_bsdf_node = nodes.new(SHADERNODES.SHADERNODE_BSDFPRINCIPLED)
         principled_bsdf_node.location = (-200, 0)
         principled_bsdf_node.width = 200
-        links.new(principled_bsdf_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_SHADER2])
+        links.new(principled_bsdf_node.outputs[SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_SHADER2])
 
-        texture_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_TEXIMAGE)
+        texture_node = nodes.new(SHADERNODES.SHADERNODE_TEXIMAGE)
         texture_node.label = 'colorMap'
         texture_node.location = (-700, 0)
         texture_node.image = texture_image
-        links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_BSDFPRINCIPLED_BASECOLOR])
+        links.new(texture_node.outputs[SHADERNODES.OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[SHADERNODES.INPUT_BSDFPRINCIPLED_BASECOLOR])
 
-        invert_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_INVERT)
+        invert_node = nodes.new(SHADERNODES.SHADERNODE_INVERT)
         invert_node.location = (-400, 0)
         
         invert_fac_default_value = 0.0
@@ -469,10 +604,10 @@ def _import_material_v14(assetpath: str, material_name: str) -> bool:
                 invert_fac_default_value = 1.0
                 break
         
-        invert_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_INVERT_FAC].default_value = invert_fac_default_value
+        invert_node.inputs[SHADERNODES.INPUT_INVERT_FAC].default_value = invert_fac_default_value
 
-        links.new(invert_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_INVERT_COLOR], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_FAC])
-        links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], invert_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_INVERT_COLOR])
+        links.new(invert_node.outputs[SHADERNODES.OUTPUT_INVERT_COLOR], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_FAC])
+        links.new(texture_node.outputs[SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], invert_node.inputs[SHADERNODES.INPUT_INVERT_COLOR])
 
         done_time_material = time.monotonic()
         log.info_log(f"Imported material: {material_name} [{round(done_time_material - start_time_material, 2)}s]")
@@ -486,26 +621,36 @@ def _import_material_v14(assetpath: str, material_name: str) -> bool:
 """
 Import a material file for CoD2 (v20) assets and create node setup
 """
-def _import_material_v20(assetpath: str, material_name: str) -> bool:
+def _import_material_v20(assetpath: str, material_name: str, payload: material_asset.Material = None) -> bool:
     if bpy.data.materials.get(material_name):
         return True
 
     start_time_material = time.monotonic()
 
-    MATERIAL = material_asset.Material()
-    material_file = os.path.join(assetpath, material_asset.Material.PATH, material_name)
-    if not MATERIAL.load(xmodel_asset.VERSIONS.COD2, material_file):
-        log.error_log(f"Error loading material: {material_name}")
-        return False
+    MATERIAL = payload
+    if MATERIAL == None:
+        MATERIAL = material_asset.Material()
+        material_file = os.path.join(assetpath, material_asset.Material.PATH, material_name)
+        if not MATERIAL.load(xmodel_asset.VERSIONS.COD2, material_file):
+            log.error_log(f"Error loading material: {material_name}")
+            return False
     
     material = bpy.data.materials.new(MATERIAL.name)
     material.use_nodes = True
     material.blend_method = 'HASHED'
     material.shadow_method = 'HASHED'
 
+    SHADERNODES = blenderutils.BLENDER_SHADERNODES
+
     nodes = material.node_tree.nodes
     links = material.node_tree.links
 
+    # bound locally, each call inside the texture loop otherwise pays the
+    # attribute chain lookups again
+    new_link = links.new
+    OUTPUT_TEXIMAGE_COLOR = SHADERNODES.OUTPUT_TEXIMAGE_COLOR
+    OUTPUT_TEXIMAGE_ALPHA = SHADERNODES.OUTPUT_TEXIMAGE_ALPHA
+
     output_node = None
     for node in nodes:
         if node.type != 'OUTPUT_MATERIAL':
@@ -516,90 +661,53 @@ def _import_material_v20(assetpath: str, material_name: str) -> bool:
             output_node = node
 
     if output_node == None:
-        output_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_OUTPUTMATERIAL)
+        output_node = nodes.new(SHADERNODES.SHADERNODE_OUTPUTMATERIAL)
 
     output_node.location = (300, 0)
 
-    mix_shader_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MIXSHADER)
+    mix_shader_node = nodes.new(SHADERNODES.SHADERNODE_MIXSHADER)
     mix_shader_node.location = (100, 0)
-    links.new(mix_shader_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MIXSHADER_SHADER], output_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_OUTPUTMATERIAL_SURFACE])
+    new_link(mix_shader_node.outputs[SHADERNODES.OUTPUT_MIXSHADER_SHADER], output_node.inputs[SHADERNODES.INPUT_OUTPUTMATERIAL_SURFACE])
 
-    transparent_bsdf_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_BSDFTRANSPARENT)
+    transparent_bsdf_node = nodes.new(SHADERNODES.SHADERNODE_BSDFTRANSPARENT)
     transparent_bsdf_node.location = (-200, 100)
-    links.new(transparent_bsdf_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_SHADER1])
+    new_link(transparent_bsdf_node.outputs[SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_SHADER1])
 
-    principled_bsdf_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_BSDFPRINCIPLED)
+    principled_bsdf_node = nodes.new(SHADERNODES.SHADERNODE_BSDFPRINCIPLED)
     principled_bsdf_node.location = (-200, 0)
     principled_bsdf_node.width = 200
-    links.new(principled_bsdf_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_SHADER2])
+    new_link(principled_bsdf_node.outputs[SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_SHADER2])
 
     for i, t in enumerate(MATERIAL.textures):
+        if t.type not in _LINKED_TEXTURE_TYPES:
+            continue
+
         texture_image = _import_texture(assetpath, t.name)
         if texture_image == False:
             continue
 
-        texture_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_TEXIMAGE)
+        texture_node = nodes.new(SHADERNODES.SHADERNODE_TEXIMAGE)
         texture_node.label = t.type
         texture_node.location = (-700, -255 * i)
         texture_node.image = texture_image
 
         if t.type == texture_asset.TEXTURE_TYPE.COLORMAP:
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_BSDFPRINCIPLED_BASECOLOR])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_FAC])
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[SHADERNODES.INPUT_BSDFPRINCIPLED_BASECOLOR])
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_ALPHA], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_FAC])
         elif t.type == texture_asset.TEXTURE_TYPE.SPECULARMAP:
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_BSDFPRINCIPLED_SPECULAR])
-            texture_node.image.colorspace_settings.name = blenderutils.BLENDER_SHADERNODES.TEXIMAGE_COLORSPACE_LINEAR
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[SHADERNODES.INPUT_BSDFPRINCIPLED_SPECULAR])
+            texture_node.image.colorspace_settings.name = SHADERNODES.TEXIMAGE_COLORSPACE_LINEAR
             texture_node.location = (-700, -255)
         elif t.type == texture_asset.TEXTURE_TYPE.NORMALMAP:
-            texture_node.image.colorspace_settings.name = blenderutils.BLENDER_SHADERNODES.TEXIMAGE_COLORSPACE_LINEAR
+            texture_node.image.colorspace_settings.name = SHADERNODES.TEXIMAGE_COLORSPACE_LINEAR
             texture_node.location = (-1900, -655)
-            
-            normal_map_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_NORMALMAP)
-            normal_map_node.location = (-450, -650)
-            normal_map_node.space = blenderutils.BLENDER_SHADERNODES.NORMALMAP_SPACE_TANGENT
-            normal_map_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_NORMALMAP_STRENGTH].default_value = 0.3
-            links.new(normal_map_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_NORMALMAP_NORMAL], principled_bsdf_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_BSDFPRINCIPLED_NORMAL])
-
-            combine_rgb_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_COMBINERGB)
-            combine_rgb_node.location = (-650, -750)
-            links.new(combine_rgb_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_COMBINERGB_IMAGE], normal_map_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_NORMALMAP_COLOR])
-
-            math_sqrt_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_sqrt_node.location = (-850, -850)
-            math_sqrt_node.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_SQRT
-            links.new(math_sqrt_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], combine_rgb_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_COMBINERGB_B])
-
-            math_subtract_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_subtract_node.location = (-1050, -850)
-            math_subtract_node.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_SUBTRACT
-            links.new(math_subtract_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], math_sqrt_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SQRT_VALUE])
-
-            math_subtract_node2 = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_subtract_node2.location = (-1250, -950)
-            math_subtract_node2.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_SUBTRACT
-            math_subtract_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SUBTRACT_VALUE1].default_value = 1.0
-            links.new(math_subtract_node2.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SUBTRACT_VALUE1])
-
-            math_power_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_power_node.location = (-1250, -750)
-            math_power_node.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_POWER
-            math_power_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_EXPONENT].default_value = 2.0
-            links.new(math_power_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SUBTRACT_VALUE2])
-
-            math_power_node2 = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_power_node2.location = (-1500, -950)
-            math_power_node2.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_POWER
-            math_power_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_EXPONENT].default_value = 2.0
-            links.new(math_power_node2.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SUBTRACT_VALUE2])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], math_power_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_BASE])
-
-            separate_rgb_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_SEPARATERGB)
-            separate_rgb_node.location = (-1500, -450)
-            links.new(separate_rgb_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_SEPARATERGB_G], combine_rgb_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_COMBINERGB_G])
-            links.new(separate_rgb_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_SEPARATERGB_G], math_power_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_BASE])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_COLOR], separate_rgb_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_SEPARATERGB_IMAGE])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], math_power_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_BASE])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], combine_rgb_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_COMBINERGB_R])
+
+            normal_group_node = nodes.new('ShaderNodeGroup')
+            normal_group_node.location = (-450, -650)
+            normal_group_node.node_tree = _get_normalmap_node_group()
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_COLOR], normal_group_node.inputs[0])
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_ALPHA], normal_group_node.inputs[1])
+            new_link(normal_group_node.outputs[0], principled_bsdf_node.inputs[SHADERNODES.INPUT_BSDFPRINCIPLED_NORMAL])
 
     done_time_material = time.monotonic()
     log.info_log(f"Imported material: {MATERIAL.name} [{round(done_time_material - start_time_material, 2)}s]")
@@ -626,9 +734,17 @@ def _import_material_v25(assetpath: str, material_name: str) -> bool:
     material.blend_method = 'HASHED'
     material.shadow_method = 'HASHED'
 
+    SHADERNODES = blenderutils.BLENDER_SHADERNODES
+
     nodes = material.node_tree.nodes
     links = material.node_tree.links
 
+    # bound locally, each call inside the texture loop otherwise pays the
+    # attribute chain lookups again
+    new_link = links.new
+    OUTPUT_TEXIMAGE_COLOR = SHADERNODES.OUTPUT_TEXIMAGE_COLOR
+    OUTPUT_TEXIMAGE_ALPHA = SHADERNODES.OUTPUT_TEXIMAGE_ALPHA
+
     output_node = None
     for node in nodes:
         if node.type != 'OUTPUT_MATERIAL':
@@ -639,90 +755,53 @@ def _import_material_v25(assetpath: str, material_name: str) -> bool:
             output_node = node
 
     if output_node == None:
-        output_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_OUTPUTMATERIAL)
+        output_node = nodes.new(SHADERNODES.SHADERNODE_OUTPUTMATERIAL)
 
     output_node.location = (300, 0)
 
-    mix_shader_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MIXSHADER)
+    mix_shader_node = nodes.new(SHADERNODES.SHADERNODE_MIXSHADER)
     mix_shader_node.location = (100, 0)
-    links.new(mix_shader_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MIXSHADER_SHADER], output_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_OUTPUTMATERIAL_SURFACE])
+    new_link(mix_shader_node.outputs[SHADERNODES.OUTPUT_MIXSHADER_SHADER], output_node.inputs[SHADERNODES.INPUT_OUTPUTMATERIAL_SURFACE])
 
-    transparent_bsdf_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_BSDFTRANSPARENT)
+    transparent_bsdf_node = nodes.new(SHADERNODES.SHADERNODE_BSDFTRANSPARENT)
     transparent_bsdf_node.location = (-200, 100)
-    links.new(transparent_bsdf_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_SHADER1])
+    new_link(transparent_bsdf_node.outputs[SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_SHADER1])
 
-    principled_bsdf_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_BSDFPRINCIPLED)
+    principled_bsdf_node = nodes.new(SHADERNODES.SHADERNODE_BSDFPRINCIPLED)
     principled_bsdf_node.location = (-200, 0)
     principled_bsdf_node.width = 200
-    links.new(principled_bsdf_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_SHADER2])
+    new_link(principled_bsdf_node.outputs[SHADERNODES.OUTPUT_BSDFTRANSPARENT_BSDF], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_SHADER2])
 
     for i, t in enumerate(MATERIAL.textures):
+        if t.type not in _LINKED_TEXTURE_TYPES:
+            continue
+
         texture_image = _import_texture(assetpath, t.name)
         if texture_image == False:
             continue
 
-        texture_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_TEXIMAGE)
+        texture_node = nodes.new(SHADERNODES.SHADERNODE_TEXIMAGE)
         texture_node.label = t.type
         texture_node.location = (-700, -255 * i)
         texture_node.image = texture_image
 
         if t.type == texture_asset.TEXTURE_TYPE.COLORMAP:
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_BSDFPRINCIPLED_BASECOLOR])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], mix_shader_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MIXSHADER_FAC])
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[SHADERNODES.INPUT_BSDFPRINCIPLED_BASECOLOR])
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_ALPHA], mix_shader_node.inputs[SHADERNODES.INPUT_MIXSHADER_FAC])
         elif t.type == texture_asset.TEXTURE_TYPE.SPECULARMAP:
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_BSDFPRINCIPLED_SPECULAR])
-            texture_node.image.colorspace_settings.name = blenderutils.BLENDER_SHADERNODES.TEXIMAGE_COLORSPACE_LINEAR
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_COLOR], principled_bsdf_node.inputs[SHADERNODES.INPUT_BSDFPRINCIPLED_SPECULAR])
+            texture_node.image.colorspace_settings.name = SHADERNODES.TEXIMAGE_COLORSPACE_LINEAR
             texture_node.location = (-700, -255)
         elif t.type == texture_asset.TEXTURE_TYPE.NORMALMAP:
-            texture_node.image.colorspace_settings.name = blenderutils.BLENDER_SHADERNODES.TEXIMAGE_COLORSPACE_LINEAR
+            texture_node.image.colorspace_settings.name = SHADERNODES.TEXIMAGE_COLORSPACE_LINEAR
             texture_node.location = (-1900, -655)
-            
-            normal_map_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_NORMALMAP)
-            normal_map_node.location = (-450, -650)
-            normal_map_node.space = blenderutils.BLENDER_SHADERNODES.NORMALMAP_SPACE_TANGENT
-            normal_map_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_NORMALMAP_STRENGTH].default_value = 0.3
-            links.new(normal_map_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_NORMALMAP_NORMAL], principled_bsdf_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_BSDFPRINCIPLED_NORMAL])
-
-            combine_rgb_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_COMBINERGB)
-            combine_rgb_node.location = (-650, -750)
-            links.new(combine_rgb_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_COMBINERGB_IMAGE], normal_map_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_NORMALMAP_COLOR])
-
-            math_sqrt_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_sqrt_node.location = (-850, -850)
-            math_sqrt_node.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_SQRT
-            links.new(math_sqrt_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], combine_rgb_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_COMBINERGB_B])
-
-            math_subtract_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_subtract_node.location = (-1050, -850)
-            math_subtract_node.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_SUBTRACT
-            links.new(math_subtract_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], math_sqrt_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SQRT_VALUE])
-
-            math_subtract_node2 = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_subtract_node2.location = (-1250, -950)
-            math_subtract_node2.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_SUBTRACT
-            math_subtract_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SUBTRACT_VALUE1].default_value = 1.0
-            links.new(math_subtract_node2.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SUBTRACT_VALUE1])
-
-            math_power_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_power_node.location = (-1250, -750)
-            math_power_node.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_POWER
-            math_power_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_EXPONENT].default_value = 2.0
-            links.new(math_power_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SUBTRACT_VALUE2])
-
-            math_power_node2 = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_MATH)
-            math_power_node2.location = (-1500, -950)
-            math_power_node2.operation = blenderutils.BLENDER_SHADERNODES.OPERATION_MATH_POWER
-            math_power_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_EXPONENT].default_value = 2.0
-            links.new(math_power_node2.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_MATH_VALUE], math_subtract_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_SUBTRACT_VALUE2])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], math_power_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_BASE])
-
-            separate_rgb_node = nodes.new(blenderutils.BLENDER_SHADERNODES.SHADERNODE_SEPARATERGB)
-            separate_rgb_node.location = (-1500, -450)
-            links.new(separate_rgb_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_SEPARATERGB_G], combine_rgb_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_COMBINERGB_G])
-            links.new(separate_rgb_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_SEPARATERGB_G], math_power_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_BASE])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_COLOR], separate_rgb_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_SEPARATERGB_IMAGE])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], math_power_node2.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_MATH_POWER_BASE])
-            links.new(texture_node.outputs[blenderutils.BLENDER_SHADERNODES.OUTPUT_TEXIMAGE_ALPHA], combine_rgb_node.inputs[blenderutils.BLENDER_SHADERNODES.INPUT_COMBINERGB_R])
+
+            normal_group_node = nodes.new('ShaderNodeGroup')
+            normal_group_node.location = (-450, -650)
+            normal_group_node.node_tree = _get_normalmap_node_group()
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_COLOR], normal_group_node.inputs[0])
+            new_link(texture_node.outputs[OUTPUT_TEXIMAGE_ALPHA], normal_group_node.inputs[1])
+            new_link(normal_group_node.outputs[0], principled_bsdf_node.inputs[SHADERNODES.INPUT_BSDFPRINCIPLED_NORMAL])
 
     done_time_material = time.monotonic()
     log.info_log(f"Imported material: {MATERIAL.name} [{round(done_time_material - start_time_material, 2)}s]")
@@ -733,37 +812,126 @@ def _import_material_v25(assetpath: str, material_name: str) -> bool:
 # TEXTURE IMPORT -------------------------------------------------------------------
 # ----------------------------------------------------------------------------------
 
+# resolved images by texture name, spares the bpy.data.images name lookup
+# when materials share textures
+_TEXTURE_CACHE: dict[str, bpy.types.Image] = {}
+
+# cached listings of the images directories, one scandir replaces a stat
+# call per texture
+_IMAGES_DIR_CACHE: dict[str, set[str]] = {}
+
+_IWI2DDS = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, 'bin', 'iwi2dds.exe'))
+
+"""
+List the file names inside the images directory of an asset path, cached
+"""
+def _list_images_dir(assetpath: str) -> set[str]:
+    images_dir = os.path.join(assetpath, texture_asset.IWi.PATH)
+    files = _IMAGES_DIR_CACHE.get(images_dir)
+    if files == None:
+        files = set()
+        try:
+            with os.scandir(images_dir) as entries:
+                files.update(entry.name for entry in entries)
+
+        except OSError:
+            pass
+
+        _IMAGES_DIR_CACHE[images_dir] = files
+
+    return files
+
+"""
+Convert IWi textures that have no .dds next to them yet,
+the iwi2dds invocations run in parallel since subprocess releases the GIL
+"""
+def _convert_textures(assetpath: str, texture_names: set[str]) -> None:
+    import subprocess
+
+    if not os.path.isfile(_IWI2DDS):
+        return
+
+    images_dir_files = _list_images_dir(assetpath)
+
+    texture_files = []
+    for texture_name in texture_names:
+        if (texture_name + '.dds') not in images_dir_files and (texture_name + '.iwi') in images_dir_files:
+            texture_files.append(os.path.join(assetpath, texture_asset.IWi.PATH, texture_name))
+
+    if len(texture_files) == 0:
+        return
+
+    def convert(texture_file: str) -> None:
+        try:
+            result = subprocess.run((_IWI2DDS, '-i', texture_file + '.iwi'), capture_output=True)
+            if result.returncode != 0:
+                log.error_log(result.stderr.decode('utf-8'))
+            else:
+                images_dir_files.add(os.path.basename(texture_file) + '.dds')
+
+        except:
+            log.error_log(traceback.print_exc())
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for _ in executor.map(convert, texture_files):
+            pass
+
 """
 Import an IWi texture file
 """
 def _import_texture(assetpath: str, texture_name: str) -> bpy.types.Texture | bool:
+    import numpy
+    import subprocess
+
     start_time_texture = time.monotonic()
-    
+
+    # the cache is keyed by the resolved path since the same texture name
+    # can exist under different asset roots
+    texture_file = os.path.join(assetpath, texture_asset.IWi.PATH, texture_name)
+    texture_file_dds = texture_file + '.dds'
+
+    texture_image = _TEXTURE_CACHE.get(texture_file)
+    if texture_image != None:
+        try:
+            if texture_image.name in bpy.data.images:
+                return texture_image
+
+        except ReferenceError:
+            # the cached reference died with an undo or a delete
+            pass
+
     texture_image = bpy.data.images.get(texture_name)
     if texture_image != None:
+        _TEXTURE_CACHE[texture_file] = texture_image
         return texture_image
 
-    texture_file = os.path.join(assetpath, texture_asset.IWi.PATH, texture_name)
+    images_dir_files = _list_images_dir(assetpath)
 
-    # if no .dds exists then try to convert it on the fly via iwi2dds 
-    if not os.path.isfile(texture_file + '.dds'):
-        iwi2dds = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, 'bin', 'iwi2dds.exe'))
-        if os.path.isfile(iwi2dds):
-            try:
-                result = subprocess.run((iwi2dds, '-i', texture_file + '.iwi'), capture_output=True)
-                if result.returncode != 0:
-                    log.error_log(result.stderr.decode('utf-8'))
+    # if no .dds exists then try to convert it on the fly via iwi2dds
+    if (texture_name + '.dds') not in images_dir_files and os.path.isfile(_IWI2DDS):
+        try:
+            result = subprocess.run((_IWI2DDS, '-i', texture_file + '.iwi'), capture_output=True)
+            if result.returncode != 0:
+                log.error_log(result.stderr.decode('utf-8'))
+            else:
+                images_dir_files.add(texture_name + '.dds')
 
-            except:
-                log.error_log(traceback.print_exc())
+        except:
+            log.error_log(traceback.print_exc())
 
-    try:
-        # try to load .dds 
-        texture_image = bpy.data.images.load(texture_file + '.dds', check_existing=True)
+    # load the .dds with blenders own loader whenever the file is there
+    texture_image = None
+    if (texture_name + '.dds') in images_dir_files:
+        try:
+            texture_image = bpy.data.images.load(texture_file_dds, check_existing=True)
 
-    except:
+        except:
+            log.error_log(traceback.print_exc())
+
+    if texture_image == None:
 
-        # if error happens when converting or loading the dds just fall back to .iwi parsing 
+        # only when both the conversion and the .dds load failed fall back
+        # to the python .iwi decoder, which is far slower
         TEXTURE = texture_asset.IWi()
         if not TEXTURE.load(texture_file + '.iwi'):
             log.error_log(f"Error loading texture: {texture_name}")
@@ -773,13 +941,20 @@ def _import_texture(assetpath: str, texture_name: str) -> bpy.types.Texture | bo
         pixels = TEXTURE.texture_data
 
         # flip the image
-        p = numpy.asarray(pixels)
-        p.shape = (TEXTURE.height, TEXTURE.width, 4)
-        p = numpy.flipud(p)
-        texture_image.pixels = p.flatten().tolist()
-
-    texture_image.file_format = 'TARGA'
-    texture_image.pack()
+        # the decoder hands back raw uint8 RGBA, the reversed row view costs
+        # nothing and the multiply fuses the cast and the normalization to
+        # 0..1 floats into one pass before the bulk upload
+        p = numpy.frombuffer(pixels, dtype=numpy.uint8).reshape(TEXTURE.height, TEXTURE.width, 4)
+        p = p[::-1]
+        p = numpy.multiply(numpy.ascontiguousarray(p), numpy.float32(1.0 / 255.0), dtype=numpy.float32)
+        texture_image.pixels.foreach_set(p.reshape(-1))
+
+        # only synthesized pixels need packing, an image loaded from a
+        # .dds already has its file on disk backing it
+        texture_image.file_format = 'TARGA'
+        texture_image.pack()
+
+    _TEXTURE_CACHE[texture_file] = texture_image
 
     done_time_texture = time.monotonic()
     log.info_log(f"Imported texture: {texture_name} [{round(done_time_texture - start_time_texture, 2)}s]")
@@ -57,6 +57,13 @@ class ENTITY_KEYS(metaclass = enum.BaseEnum):
     ORIGIN = 'origin'
     MODELSCALE = 'modelscale'
 
+# per lump readers are built once, the namedtuple classes and compiled
+# structs used to be recreated on every single read
+_READ_MATERIAL = file_io.make_reader(LUMPSIZES.v59_MATERIALS, collections.namedtuple('material', 'name, flag'))
+_READ_TRIANGLESOUP = file_io.make_reader(LUMPSIZES.v59_TRIANGLESOUPS, collections.namedtuple('trianglesoup', 'material_idx, draw_order, vertices_offset, vertices_length, triangles_length, triangles_offset'))
+_READ_VERTEX_V59 = file_io.make_reader(LUMPSIZES.v59_VERTICES, collections.namedtuple('vertex', 'px, py, pz, u, v, nx, ny, nz, red, green, blue, alpha'))
+_READ_VERTEX_V4 = file_io.make_reader(LUMPSIZES.v4_VERTICES, collections.namedtuple('vertex', 'px, py, pz, nx, ny, nz, red, green, blue, alpha, u, v'))
+
 """
 IBSP version constants
 """
@@ -109,10 +116,7 @@ class IBSP:
             self.flag = flag
 
         def read(self, file: bytes, version: int) -> None:
-            if version == VERSIONS.COD1:
-                material = file_io.read_fmt(file, LUMPSIZES.v59_MATERIALS, collections.namedtuple('material', 'name, flag'))
-            else:
-                material = file_io.read_fmt(file, LUMPSIZES.v4_MATERIALS, collections.namedtuple('material', 'name, flag'))
+            material = _READ_MATERIAL(file)
 
             self.name = material.name.rstrip(b'\x00').decode('utf-8')
             self.flag = material.flag
@@ -129,11 +133,7 @@ class IBSP:
             self.triangles_length = triangles_length
 
         def read(self, file: bytes, version: int) -> None:
-            if version == VERSIONS.COD1:
-                trianglesoup = file_io.read_fmt(file, LUMPSIZES.v59_TRIANGLESOUPS, collections.namedtuple('trianglesoup', 'material_idx, draw_order, vertices_offset, vertices_length, triangles_length, triangles_offset'))
-            else:
-                trianglesoup = file_io.read_fmt(file, LUMPSIZES.v4_TRIANGLESOUPS, collections.namedtuple('trianglesoup', 'material_idx, draw_order, vertices_offset, vertices_length, triangles_length, triangles_offset'))
-
+            trianglesoup = _READ_TRIANGLESOUP(file)
 
             self.material_idx = trianglesoup.material_idx
             self.draw_order = trianglesoup.draw_order
@@ -154,10 +154,9 @@ class IBSP:
 
         def read(self, file: bytes, version: int) -> None:
             if version == VERSIONS.COD1:
-                vertex = file_io.read_fmt(file, LUMPSIZES.v59_VERTICES, collections.namedtuple('vertex', 'px, py, pz, u, v, nx, ny, nz, red, green, blue, alpha'))
+                vertex = _READ_VERTEX_V59(file)
             else:
-                vertex = file_io.read_fmt(file, LUMPSIZES.v4_VERTICES, collections.namedtuple('vertex', 'px, py, pz, nx, ny, nz, red, green, blue, alpha, u, v'))
-
+                vertex = _READ_VERTEX_V4(file)
 
             self.position = mathutils.Vector((
                 vertex.px,
@@ -199,6 +198,33 @@ class IBSP:
             self.vertices = vertices
             self.triangles = triangles
 
+        def positions_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.fromiter((c for vertex in self.vertices.values() for c in vertex.position), dtype=numpy.float32, count=len(self.vertices) * 3).reshape(-1, 3)
+
+        def normals_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.fromiter((c for vertex in self.vertices.values() for c in vertex.normal), dtype=numpy.float32, count=len(self.vertices) * 3).reshape(-1, 3)
+
+        def uvs_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.fromiter((c for vertex in self.vertices.values() for c in (vertex.uv.u, vertex.uv.v)), dtype=numpy.float32, count=len(self.vertices) * 2).reshape(-1, 2)
+
+        def colors_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.fromiter((c for vertex in self.vertices.values() for c in (vertex.color.red, vertex.color.green, vertex.color.blue, vertex.color.alpha)), dtype=numpy.float32, count=len(self.vertices) * 4).reshape(-1, 4)
+
+        def triangles_array(self) -> numpy.ndarray:
+            import numpy
+
+            # triangles reference map-global vertex ids, remap them to local indices
+            vertex_ids = {vertex_id: i for i, vertex_id in enumerate(self.vertices)}
+            return numpy.array([(vertex_ids[t[0]], vertex_ids[t[1]], vertex_ids[t[2]]) for t in self.triangles], dtype=numpy.int32).reshape(-1, 3)
+
     # --------------------------------------------------------------------------------------------
 
     __slots__ = ('name', 'version', 'surfaces', 'entities', 'materials')
@@ -269,7 +295,9 @@ class IBSP:
 
         return vertices
 
-    def _read_triangles(self, file: bytes, version: int, lumps: list[_lump]) -> list[tuple]:
+    def _read_triangles(self, file: bytes, version: int, lumps: list[_lump]) -> numpy.ndarray:
+        import numpy
+
         if version == VERSIONS.COD1:
             triangles_lump = lumps[LUMPS.v59_TRIANGLES]
             triangles_size = LUMPSIZES.v59_TRIANGLES
@@ -277,13 +305,14 @@ class IBSP:
             triangles_lump = lumps[LUMPS.v4_TRIANGLES]
             triangles_size = LUMPSIZES.v4_TRIANGLES
 
-        triangles = []
+        # the lump is a flat array of uint16 index triplets, so the whole
+        # thing decodes in one numpy call instead of one read per triangle,
+        # widened to int32 right away because the indices get the uint32
+        # soup vertices_offset added on top and must not wrap at 65535
+        triangle_size = struct.calcsize(triangles_size)
         file.seek(triangles_lump.offset, os.SEEK_SET)
-        for _ in range(0, triangles_lump.length, struct.calcsize(triangles_size)):
-            triangle = file_io.read_fmt(file, triangles_size)
-            triangles.append(triangle)
-
-        return triangles
+        triangle_data = file.read(triangles_lump.length - (triangles_lump.length % triangle_size))
+        return numpy.frombuffer(triangle_data, dtype=numpy.uint16).astype(numpy.int32).reshape(-1, 3)
 
     def _parse_transform(self, transform: str, default_value: float) -> tuple:
         t = transform.split(' ')
@@ -357,7 +386,9 @@ class IBSP:
     def load(self, map: str) -> bool:
         self.name = os.path.splitext(os.path.basename(map))[0]
         try:
-            with open(map, 'rb') as file:
+            with open(map, 'rb') as f:
+                file = file_io.BufferReader(f.read())
+
                 header = file_io.read_fmt(file, '4si', collections.namedtuple('header', 'magic, version'))
                 header_magic = header.magic.decode('utf-8')
                 if header_magic != self.MAGIC or header.version not in VERSIONS:
@@ -36,7 +36,9 @@ class Material:
     def load(self, version: int, material: str) -> bool:
         self.name = os.path.basename(material)
         try:
-            with open(material, 'rb') as file:
+            with open(material, 'rb') as f:
+                file = file_io.BufferReader(f.read())
+
                 name_offset = file_io.read_uint(file)
 
                 current_offset = file.tell()
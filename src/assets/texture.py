@@ -88,7 +88,9 @@ class IWi:
     def load(self, texture: str) -> bool:
         self.name = os.path.splitext(os.path.basename(texture))[0]
         try:
-            with open(texture, 'rb') as file:
+            with open(texture, 'rb') as f:
+                file = file_io.BufferReader(f.read())
+
                 header = file_io.read_fmt(file, '3sB', collections.namedtuple('header', 'magic, version'))
                 header_magic = header.magic.decode('utf-8')
                 if header_magic != self.MAGIC or header.version not in self.VERSIONS:
@@ -132,7 +132,9 @@ class XModel:
     def load(self, xmodel: str) -> bool:
         self.name = os.path.basename(xmodel)
         try:
-            with open(xmodel, 'rb') as file:
+            with open(xmodel, 'rb') as f:
+                file = file_io.BufferReader(f.read())
+
                 version = file_io.read_ushort(file)
                 if version not in VERSIONS:
                     log.info_log(f'xmodel version {version} is not supported')
@@ -15,6 +15,11 @@ from .. utils import (
     log
 )
 
+# prebuilt readers for the per bone hot loop, the namedtuple classes used
+# to be recreated for every bone
+_READ_HEADER = file_io.make_reader('2H', collections.namedtuple('header', 'bone_count, root_bone_count'))
+_READ_RAW_BONE = file_io.make_reader('B3f3h', collections.namedtuple('raw_bone_data', 'parent, px, py, pz, rx, ry, rz'))
+
 """
 XModelPart represents an xmodelpart structure
 """
@@ -171,7 +176,7 @@ class XModelPart:
         self.bones = []
 
     def _load_v14(self, file: bytes) -> bool:
-        header = file_io.read_fmt(file, '2H', collections.namedtuple('header', 'bone_count, root_bone_count'))
+        header = _READ_HEADER(file)
         for _ in range(header.root_bone_count):
             rotation = mathutils.Quaternion()
             position = mathutils.Vector()
@@ -182,7 +187,7 @@ class XModelPart:
         for _ in range(header.bone_count):
 
             # read raw bone data
-            raw_bone_data = file_io.read_fmt(file, 'B3f3h', collections.namedtuple('raw_bone_data', 'parent, px, py, pz, rx, ry, rz'))
+            raw_bone_data = _READ_RAW_BONE(file)
             
             qx = raw_bone_data.rx / self.ROTATION_DIVISOR
             qy = raw_bone_data.ry / self.ROTATION_DIVISOR
@@ -226,7 +231,7 @@ class XModelPart:
         return True
 
     def _load_v20(self, file: bytes) -> bool:
-        header = file_io.read_fmt(file, '2H', collections.namedtuple('header', 'bone_count, root_bone_count'))
+        header = _READ_HEADER(file)
         for _ in range(header.root_bone_count):
             rotation = mathutils.Quaternion()
             position = mathutils.Vector()
@@ -237,7 +242,7 @@ class XModelPart:
         for _ in range(header.bone_count):
 
             # read raw bone data
-            raw_bone_data = file_io.read_fmt(file, 'B3f3h', collections.namedtuple('raw_bone_data', 'parent, px, py, pz, rx, ry, rz'))
+            raw_bone_data = _READ_RAW_BONE(file)
             
             qx = raw_bone_data.rx / self.ROTATION_DIVISOR
             qy = raw_bone_data.ry / self.ROTATION_DIVISOR
@@ -279,7 +284,7 @@ class XModelPart:
         return True
 
     def _load_v25(self, file: bytes) -> bool:
-        header = file_io.read_fmt(file, '2H', collections.namedtuple('header', 'bone_count, root_bone_count'))
+        header = _READ_HEADER(file)
         for _ in range(header.root_bone_count):
             rotation = mathutils.Quaternion()
             position = mathutils.Vector()
@@ -290,7 +295,7 @@ class XModelPart:
         for _ in range(header.bone_count):
 
             # read raw bone data
-            raw_bone_data = file_io.read_fmt(file, 'B3f3h', collections.namedtuple('raw_bone_data', 'parent, px, py, pz, rx, ry, rz'))
+            raw_bone_data = _READ_RAW_BONE(file)
             
             qx = raw_bone_data.rx / self.ROTATION_DIVISOR
             qy = raw_bone_data.ry / self.ROTATION_DIVISOR
@@ -328,7 +333,9 @@ class XModelPart:
         self.name = os.path.basename(xmodel_part)
         self.model_type = self.name[-1]
         try:
-            with open(xmodel_part, 'rb') as file:
+            with open(xmodel_part, 'rb') as f:
+                file = file_io.BufferReader(f.read())
+
                 version = file_io.read_ushort(file)
                 if version not in xmodel.VERSIONS:
                     log.info_log(f'xmodelpart version {version} is not supported')
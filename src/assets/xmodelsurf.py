@@ -70,6 +70,31 @@ class XModelSurf:
             self.vertices = vertices
             self.triangles = triangles
 
+        def positions_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.fromiter((c for vertex in self.vertices for c in vertex.position), dtype=numpy.float32, count=len(self.vertices) * 3).reshape(-1, 3)
+
+        def normals_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.fromiter((c for vertex in self.vertices for c in vertex.normal), dtype=numpy.float32, count=len(self.vertices) * 3).reshape(-1, 3)
+
+        def uvs_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.fromiter((c for vertex in self.vertices for c in (vertex.uv.u, vertex.uv.v)), dtype=numpy.float32, count=len(self.vertices) * 2).reshape(-1, 2)
+
+        def colors_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.fromiter((c for vertex in self.vertices for c in (vertex.color.red, vertex.color.green, vertex.color.blue, vertex.color.alpha)), dtype=numpy.float32, count=len(self.vertices) * 4).reshape(-1, 4)
+
+        def triangles_array(self) -> numpy.ndarray:
+            import numpy
+
+            return numpy.array(self.triangles, dtype=numpy.int32).reshape(-1, 3)
+
     # --------------------------------------------------------------------------------------------
 
     __slots__ = ('name', 'version', 'surfaces')
@@ -342,7 +367,9 @@ class XModelSurf:
     def load(self, xmodel_surf: str, xmodel_part: xmodelpart.XModelPart = None) -> bool:
         self.name = os.path.basename(xmodel_surf)
         try:
-            with open(xmodel_surf, 'rb') as file:
+            with open(xmodel_surf, 'rb') as f:
+                file = file_io.BufferReader(f.read())
+
                 version = file_io.read_ushort(file)
                 if version not in xmodel.VERSIONS:
                     log.info_log(f'xmodelsurf version {version} is not supported')
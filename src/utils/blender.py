@@ -22,6 +22,16 @@ def copy_object_hierarchy(obj: bpy.types.Object) -> list[bpy.types.Object]:
     bpy.ops.object.duplicate()
     return bpy.context.selected_objects
 
+"""
+Moves an object and all of its children into a collection
+"""
+def move_object_hierarchy_to_collection(obj: bpy.types.Object, collection: bpy.types.Collection) -> None:
+    for current_collection in obj.users_collection:
+        current_collection.objects.unlink(obj)
+    collection.objects.link(obj)
+    for children in obj.children:
+        move_object_hierarchy_to_collection(children, collection)
+
 
 """
 Blender shader node constants to make node setup a bit more readable
@@ -16,7 +16,7 @@ class DECODE_FORMAT(metaclass = enum.BaseEnum):
     DXT5 = 0x0D
 
 """
-Decode according to format
+Decode according to format, the result is raw 8 bit RGBA data
 """
 def decode(input: bytes, width: int, height: int, format: int) -> bytes:
     if format == DECODE_FORMAT.DXT1:
@@ -75,10 +75,10 @@ def _c3(component0: int, component1: int) -> int:
 """
 Decode DXT1 encoding
 """
-def _decodeDXT1(input: bytes, width: int, height: int) -> tuple:
+def _decodeDXT1(input: bytes, width: int, height: int) -> bytes:
     input = io.BytesIO(input)
-    output = [0.0] * (width * height * 4)
-    buffer = [0.0] * (64)
+    output = bytearray(width * height * 4)
+    buffer = bytearray(64)
     
     block_count_x = (width + 3) // 4
     block_count_y = (height + 3) // 4
@@ -100,7 +100,7 @@ def _decodeDXT1(input: bytes, width: int, height: int) -> tuple:
             for i in range(16):
                 idx = i * 4
                 r, g, b, a = _unpack_rgba(colors[bitcode & 0x03])                
-                buffer[idx:idx+4] = r / 255, g / 255, b / 255, a / 255
+                buffer[idx:idx+4] = (r, g, b, a)
                 bitcode >>= 2
                         
             length = (4 if x < block_count_x - 1 else length_last) * 4
@@ -115,16 +115,16 @@ def _decodeDXT1(input: bytes, width: int, height: int) -> tuple:
                 i += 1
                 j += 1
 
-    return tuple(output)
+    return bytes(output)
 
 
 """
 Decode a DXT3 encoding
 """
-def _decodeDXT3(input: bytes, width: int, height: int) -> tuple:
+def _decodeDXT3(input: bytes, width: int, height: int) -> bytes:
     input = io.BytesIO(input)
-    output = [0.0] * (width * height * 4)
-    buffer = [0.0] * (64)
+    output = bytearray(width * height * 4)
+    buffer = bytearray(64)
 
     block_count_x = (width + 3) // 4
     block_count_y = (height + 3) // 4
@@ -154,7 +154,7 @@ def _decodeDXT3(input: bytes, width: int, height: int) -> tuple:
             for i in range(16):
                 idx = i * 4
                 r, g, b, a = _unpack_rgba(colors[bitcode & 0x03] | alphas[i])
-                buffer[idx:idx+4] = r / 255, g / 255, b / 255, a / 255
+                buffer[idx:idx+4] = (r, g, b, a)
                 bitcode >>= 2
 
             length = (4 if x < block_count_x - 1 else length_last) * 4
@@ -169,15 +169,15 @@ def _decodeDXT3(input: bytes, width: int, height: int) -> tuple:
                 i += 1
                 j += 1
 
-    return tuple(output)
+    return bytes(output)
 
 """
 Decode DXT5 encoding
 """
-def _decodeDXT5(input: bytes, width: int, height: int) -> tuple:
+def _decodeDXT5(input: bytes, width: int, height: int) -> bytes:
     input = io.BytesIO(input)
-    output = [0.0] * (width * height * 4)
-    buffer = [0.0] * (64)
+    output = bytearray(width * height * 4)
+    buffer = bytearray(64)
 
     block_count_x = (width + 3) // 4
     block_count_y = (height + 3) // 4
@@ -221,7 +221,7 @@ def _decodeDXT5(input: bytes, width: int, height: int) -> tuple:
             for i in range(16):
                 idx = i * 4
                 r, g, b, a = _unpack_rgba(alphas[bitcode_a & 0x07] | colors[bitcode_c & 0x03])
-                buffer[idx:idx+4] = r / 255, g / 255, b / 255, a / 255
+                buffer[idx:idx+4] = (r, g, b, a)
                 bitcode_a >>= 3
                 bitcode_c >>= 2
 
@@ -237,7 +237,7 @@ def _decodeDXT5(input: bytes, width: int, height: int) -> tuple:
                 i += 1
                 j += 1
 
-    return tuple(output)
+    return bytes(output)
 
             
 
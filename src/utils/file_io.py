@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import os
 import struct
 import traceback
 
@@ -27,14 +28,61 @@ class FMT_CHARACTER_CONSTANTS(metaclass = enum.BaseEnum):
     FLOAT =                 'f' # float
     DOUBLE =                'd' # double
 
+"""
+File like reader over an in-memory buffer. The asset loaders read each
+file once and parse from memory, so a field access is an offset bump
+instead of an IO call
+"""
+class BufferReader:
+
+    __slots__ = ('buf', 'pos')
+
+    def __init__(self, buf: bytes, pos: int = 0) -> None:
+        self.buf = buf
+        self.pos = pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = len(self.buf) - self.pos
+
+        data = self.buf[self.pos : self.pos + size]
+        self.pos += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.pos
+        elif whence == os.SEEK_END:
+            offset += len(self.buf)
+
+        self.pos = offset
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+# compiled structs are cached by full format so repeated reads skip
+# re-parsing the format string every call
+_STRUCT_CACHE: dict[str, struct.Struct] = {}
+
+# single character formats unpack to a lone value, checked against a
+# frozenset since the enum membership test walks all its constants
+_SCALAR_FMTS = frozenset(FMT_CHARACTER_CONSTANTS)
+
 """
 Read bytes as a specific format described by fmt_str. Optionally return the result as a namedtuple
 """
 def read_fmt(file: bytes, fmt_str: str, namedtuple: collections.namedtuple = None, fmt_byte_order: str = '<') -> tuple | collections.namedtuple | int | float:
     fmt = fmt_byte_order + fmt_str
-    size = struct.calcsize(fmt)
-    data_raw = file.read(size)
-    data_unpacked = struct.unpack(fmt, data_raw)
+    fmt_struct = _STRUCT_CACHE.get(fmt)
+    if fmt_struct == None:
+        fmt_struct = _STRUCT_CACHE.setdefault(fmt, struct.Struct(fmt))
+
+    if isinstance(file, BufferReader):
+        data_unpacked = fmt_struct.unpack_from(file.buf, file.pos)
+        file.pos += fmt_struct.size
+    else:
+        data_unpacked = fmt_struct.unpack(file.read(fmt_struct.size))
 
     if namedtuple:
         try:
@@ -42,96 +90,147 @@ def read_fmt(file: bytes, fmt_str: str, namedtuple: collections.namedtuple = Non
         except:
             log.error_log(traceback.print_exc())
 
-    if fmt_str in FMT_CHARACTER_CONSTANTS:
+    if len(fmt_str) == 1 and fmt_str in _SCALAR_FMTS:
         return data_unpacked[0]
 
     return data_unpacked
 
+"""
+Build a specialized reader for a fixed format, optionally wrapping the
+result in a namedtuple. The struct and the namedtuple binding are
+resolved once so the returned callable does no per-call setup
+"""
+def make_reader(fmt_str: str, namedtuple: collections.namedtuple = None, fmt_byte_order: str = '<') -> callable:
+    fmt_struct = struct.Struct(fmt_byte_order + fmt_str)
+    size = fmt_struct.size
+    unpack = fmt_struct.unpack
+
+    if namedtuple != None:
+        make = namedtuple._make
+        def reader(file: bytes) -> collections.namedtuple:
+            return make(unpack(file.read(size)))
+
+    elif len(fmt_str) == 1 and fmt_str in _SCALAR_FMTS:
+        def reader(file: bytes) -> int | float:
+            return unpack(file.read(size))[0]
+
+    else:
+        def reader(file: bytes) -> tuple:
+            return unpack(file.read(size))
+
+    return reader
+
+# the single value readers below bypass read_fmt entirely and unpack with
+# precompiled structs, they are the hottest calls in the binary parsers
+_STRUCT_CHAR = struct.Struct('<c')
+_STRUCT_SCHAR = struct.Struct('<b')
+_STRUCT_UCHAR = struct.Struct('<B')
+_STRUCT_SHORT = struct.Struct('<h')
+_STRUCT_USHORT = struct.Struct('<H')
+_STRUCT_INT = struct.Struct('<i')
+_STRUCT_UINT = struct.Struct('<I')
+_STRUCT_LONG = struct.Struct('<l')
+_STRUCT_ULONG = struct.Struct('<L')
+_STRUCT_LONGLONG = struct.Struct('<q')
+_STRUCT_ULONGLONG = struct.Struct('<Q')
+_STRUCT_FLOAT = struct.Struct('<f')
+_STRUCT_DOUBLE = struct.Struct('<d')
+
 """
 Read a character
 """
 def read_char(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.CHAR)
+    return _STRUCT_CHAR.unpack(file.read(1))[0]
 
 """
 Read a signed character
 """
 def read_schar(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.SIGNED_CHAR)
+    return _STRUCT_SCHAR.unpack(file.read(1))[0]
 
 """
 Read an unsigned character
 """
 def read_uchar(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.UNSIGNED_CHAR)
+    return _STRUCT_UCHAR.unpack(file.read(1))[0]
 
 """
 Read a short
 """
 def read_short(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.SHORT)
+    return _STRUCT_SHORT.unpack(file.read(2))[0]
 
 """
 Read an unsigned short
 """
 def read_ushort(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.UNSIGNED_SHORT)
+    return _STRUCT_USHORT.unpack(file.read(2))[0]
 
 """
-Read an integer 
+Read an integer
 """
 def read_int(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.INTEGER)
+    return _STRUCT_INT.unpack(file.read(4))[0]
 
 """
-Read an unsigned integer 
+Read an unsigned integer
 """
 def read_uint(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.UNSIGNED_INTEGER)
+    return _STRUCT_UINT.unpack(file.read(4))[0]
 
 """
 Read a long
 """
 def read_long(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.LONG)
+    return _STRUCT_LONG.unpack(file.read(4))[0]
 
 """
-Read an unsigned long 
+Read an unsigned long
 """
 def read_ulong(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.UNSIGNED_LONG)
+    return _STRUCT_ULONG.unpack(file.read(4))[0]
 
 """
-Read a long long 
+Read a long long
 """
 def read_longlong(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.LONG_LONG)
+    return _STRUCT_LONGLONG.unpack(file.read(8))[0]
 
 """
 Read an unsigned long long
 """
 def read_ulonglong(file: bytes) -> int:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.UNSIGNED_LONG_LONG)
+    return _STRUCT_ULONGLONG.unpack(file.read(8))[0]
 
 """
-Read a float 
+Read a float
 """
 def read_float(file: bytes) -> float:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.FLOAT)
+    return _STRUCT_FLOAT.unpack(file.read(4))[0]
 
 """
-Read a double 
+Read a double
 """
 def read_double(file: bytes) -> float:
-    return read_fmt(file, FMT_CHARACTER_CONSTANTS.DOUBLE)
+    return _STRUCT_DOUBLE.unpack(file.read(8))[0]
 
 """
-Read a null terminated string 
+Read a null terminated string
 """
-def read_nullstr(file: bytes) -> str:
-    string = b''
-    character = None
-    while(character != b'\x00'):
-        character = file.read(1)
-        string += character
-    return string.rstrip(b'\x00').decode('utf-8')
\ No newline at end of file
+def read_nullstr(file: bytes, chunk_size: int = 256) -> str:
+    chunks = []
+    while True:
+        position = file.tell()
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+
+        terminator = chunk.find(b'\x00')
+        if terminator >= 0:
+            chunks.append(chunk[:terminator])
+            file.seek(position + terminator + 1)
+            break
+
+        chunks.append(chunk)
+
+    return b''.join(chunks).decode('utf-8')
\ No newline at end of file